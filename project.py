@@ -4,36 +4,34 @@ import csv
 import sys
 import argparse
 import requests
+import numpy as np
 
 from tabulate import tabulate
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 from os import system
 from time import sleep
 
 
 class Round:
-    def __init__(self, settings):
+    def __init__(self, settings, scheduler=None):
         # Set round customisable settings
         self.lives = settings["lives"]
         self.hangmen = load_hangmen(settings["hangmen"])
 
-        # Get word based on topic
+        # Get word based on topic, from session's scheduler if given
         match settings["topic"]:
             case "cities":
                 self.word, self.hint = get_city(settings["level"])
+            case _ if scheduler:
+                self.word = scheduler.next_word()
+                self.hint = ""
             case _:
                 self.word = get_word(settings["word_path"])
                 self.hint = ""
 
         # Set score multiplier based on max lives
-        match self.lives:
-            case 10:
-                self.multiplier = 1
-            case 7:
-                self.multiplier = 1.5
-            case 5:
-                self.multiplier = 3
-            case _:
-                sys.exit("Invalid number of lives")
+        self.multiplier = get_multiplier(self.lives)
 
         # Initialise game variables
         self.correct_guesses = []
@@ -69,7 +67,10 @@ class Round:
         return hidden_word
 
     def play(self):
-        """Allow user to make a guess and check and record that guess until round is won/lost"""
+        """Allow user to make a guess and check and record that guess until round is won/lost
+
+        Round is not ended so the next round can be prepared before calling end
+        """
 
         print()
 
@@ -86,7 +87,6 @@ class Round:
             print(self.check_guess(guess))
 
         self.score = self.calculate_score()
-        self.end()
 
         return self.score
 
@@ -200,6 +200,157 @@ class Round:
         return None
 
 
+class WordScheduler:
+    """Draws words from a shared corpus without repeats until all have been drawn"""
+
+    def __init__(self, words, seed=None):
+        # Corpus is shared and never modified
+        self.words = words
+        self.random = random.Random(seed)
+
+        # Positions of the lazily shuffled permutation that differ from the corpus
+        self.swaps = {}
+        self.drawn = 0
+
+    def next_word(self):
+        """Returns the next word of the shuffled corpus using Fisher-Yates swaps"""
+
+        if not self.words:
+            sys.exit("No words to choose from")
+
+        # Start a new permutation once every word has been drawn
+        if self.drawn == len(self.words):
+            self.swaps = {}
+            self.drawn = 0
+
+        # Swap a random undrawn position into the next drawn position
+        i = self.drawn
+        j = self.random.randrange(i, len(self.words))
+        word = self.swaps.get(j, j)
+        if j == i:
+            self.swaps.pop(i, None)
+        else:
+            self.swaps[j] = self.swaps.pop(i, i)
+        self.drawn += 1
+
+        return self.words[word]
+
+
+class BatchRound:
+    """Plays the same round rules over many words at once using NumPy arrays"""
+
+    def __init__(self, words, lives):
+        # Encode words as a padded letter matrix
+        self.words = words
+        self.letters, self.alphabet, self.lowered = encode_words(words)
+        self.multiplier = get_multiplier(lives)
+
+        # Initialise game variables, one entry per word
+        self.lives = np.full(len(words), lives, dtype=np.int16)
+        self.correct_guesses = np.zeros(len(words), dtype=np.int16)
+        self.guessed = np.zeros((len(words), len(self.alphabet) + 1), dtype=bool)
+        self.revealed = self.letters == 0
+        self.won = np.zeros(len(words), dtype=bool)
+
+    def hide_letters(self, i):
+        """Replaces unguessed letter chars of the ith word with _"""
+
+        # Constructs hidden word from the revealed mask
+        hidden_word = ""
+        for char, revealed in zip(self.words[i], self.revealed[i]):
+            hidden_word += char if revealed else "_"
+
+        return hidden_word
+
+    def check_guess(self, guess):
+        """Check and record a guess for every round still being played
+
+        guess is either one letter applied to all rounds or a string with one letter per round
+        """
+
+        # Ensure one guess for every round or one guess per round
+        if len(guess) not in [1, len(self.words)]:
+            raise ValueError(
+                f"Please guess 1 or {len(self.words)} characters, not {len(guess)}"
+            )
+
+        codes = np.broadcast_to(self.encode_guess(guess), self.lives.shape)
+
+        # Skip rounds that have ended, invalid guesses and repeated guesses
+        rows = np.arange(len(self.words))
+        valid = ~self.has_ended() & (codes > 0) & ~self.guessed[rows, codes]
+        self.guessed[rows, codes] |= valid
+
+        # Check if guesses are correct
+        matches = (self.letters == codes[:, None]) & valid[:, None]
+        correct = matches.any(axis=1)
+
+        # Check words with irregular lowercase against the whole word as Round does
+        if self.lowered:
+            chars = {code: char for char, code in self.alphabet.items()}
+            for i, word in self.lowered.items():
+                correct[i] = valid[i] and chars[codes[i]] in word
+
+        # Reveal matching letters of correct guesses
+        self.revealed |= matches & correct[:, None]
+
+        # Record correct guesses and reduce lives for incorrect guesses
+        self.correct_guesses += correct
+        self.lives -= valid & ~correct
+
+        # Update won with the new guess
+        self.has_ended()
+
+        return None
+
+    def encode_guess(self, guess):
+        """Returns the letter code of each char of guess, with 0 for invalid guesses"""
+
+        # Code each distinct char once
+        points = np.array([guess]).view(np.uint32)
+        chars, inverse = np.unique(points, return_inverse=True)
+        codes = np.zeros(len(chars), dtype=np.int64)
+        for i, char in enumerate(chars):
+            char = chr(char).lower()
+
+            # Letters in no word get a new code so they are wrong guesses
+            if len(char) == 1 and char.isalpha():
+                codes[i] = self.alphabet.setdefault(char, len(self.alphabet) + 1)
+
+        # Widen guessed letters to include any new codes
+        new_codes = len(self.alphabet) + 1 - self.guessed.shape[1]
+        if new_codes:
+            self.guessed = np.pad(self.guessed, ((0, 0), (0, new_codes)))
+
+        return codes[inverse.reshape(-1)]
+
+    def blanks(self):
+        """Counts the unguessed letters of each word"""
+
+        return (~self.revealed).sum(axis=1)
+
+    def has_ended(self):
+        """Check which rounds have met win/lose conditions"""
+
+        # Rounds are won once fully guessed with lives remaining
+        out_of_lives = self.lives <= 0
+        self.won = ~out_of_lives & (self.blanks() == 0)
+
+        return out_of_lives | self.won
+
+    def calculate_score(self):
+        """Calculates score for each round"""
+
+        # Add 10 points per correct letter and remaining lives
+        score = 10 * self.correct_guesses.astype(np.int64)
+        score += 10 * self.lives
+
+        # Add up to 50 points based on remaining blanks
+        score += 10 * np.maximum(5 - self.blanks(), 0)
+
+        return (score * self.multiplier).astype(np.int64)
+
+
 def main():
     # Get settings from command line arguments
     settings = get_settings()
@@ -213,15 +364,35 @@ def main():
     # Get hangman topic if not already given
     settings = set_settings(settings)
 
-    # Play rounds until a round is lost
-    while True:
-        round = Round(settings)
-        score += round.play()
-        if not round.won:
-            break
+    # Draw words without repeats for the session
+    scheduler = None
+    if "word_path" in settings:
+        scheduler = WordScheduler(get_corpus(settings["word_path"]), settings["seed"])
 
-    # Update and show leaderboard
-    leaderboard = update_leaderboard(username, score, settings["leaderboard_path"])
+    # Prepare rounds and update leaderboard in background during countdowns
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        next_round = executor.submit(Round, settings, scheduler)
+
+        # Play rounds until a round is lost
+        while True:
+            round = next_round.result()
+            score += round.play()
+
+            # Prepare next round if won, else update leaderboard
+            if round.won:
+                next_round = executor.submit(Round, settings, scheduler)
+            else:
+                leaderboard = executor.submit(
+                    update_leaderboard, username, score, settings["leaderboard_path"]
+                )
+
+            round.end()
+            if not round.won:
+                break
+
+        leaderboard = leaderboard.result()
+
+    # Show leaderboard
     print(tabulate(leaderboard, headers="keys", numalign="right", tablefmt="grid"))
     print(f"Your score: {score}")
 
@@ -254,6 +425,7 @@ def get_settings():
     parser.add_argument(
         "-lvl", "--level", choices=["1", "2", "3"], help="Level for certain topics"
     )
+    parser.add_argument("--seed", help="Seed for the order of words", type=int)
     args = parser.parse_args()
 
     level = ""
@@ -270,6 +442,7 @@ def get_settings():
         "hangmen": f"./hangmen/{args.style}/{args.lives}.txt",
         "topic": args.topic,
         "level": level,
+        "seed": args.seed,
     }
 
 
@@ -334,7 +507,21 @@ def get_option(param, options):
 def get_word(path):
     """Gets a word from the given file path"""
 
-    words = []
+    # Check if file exists
+    try:
+        file = open(path)
+    except FileNotFoundError:
+        sys.exit("File does not exist")
+    else:
+        file.close()
+
+    # Return random word
+    return random.choice(load_words(path))
+
+
+@cache
+def get_corpus(path):
+    """Returns a read-only tuple of all words from the given file path, loaded once"""
 
     # Check if file exists
     try:
@@ -344,14 +531,54 @@ def get_word(path):
     else:
         file.close()
 
+    return tuple(load_words(path))
+
+
+def load_words(path):
+    """Returns a list of all words from the given file path"""
+
+    words = []
+
     # Load all words into list
     with open(path) as file:
         for line in file:
             if not line.isspace():
                 words.append(line.strip())
 
-    # Return random word
-    return random.choice(words)
+    return words
+
+
+def encode_words(words):
+    """Returns a padded matrix of letter codes, the alphabet mapping letters to codes
+    and the lowercase form of words that do not lowercase char by char
+
+    Letters are coded from 1 by their lowercase form, non-letters and padding are coded 0
+    """
+
+    # View words as a padded matrix of unicode code points
+    words = np.array(words, dtype=str)
+    points = words.view(np.uint32).reshape(len(words), words.itemsize // 4)
+
+    # Code each distinct char once in a lookup table indexed by code point
+    alphabet = {}
+    codes = np.zeros(points.max(initial=0) + 1, dtype=np.int64)
+    irregular = np.zeros(points.max(initial=0) + 1, dtype=bool)
+    for point in np.flatnonzero(np.bincount(points.ravel())):
+        char = chr(point)
+        if char.isalpha():
+            codes[point] = alphabet.setdefault(char.lower(), len(alphabet) + 1)
+
+        # Mark chars like "İ" and "Σ" that do not lowercase the same on their own
+        lower = char.lower()
+        irregular[point] = len(lower) != 1 or ("a" + char).lower()[1:] != lower
+
+    # Lowercase words with irregular chars as a whole
+    lowered = {}
+    for i in np.flatnonzero(irregular[points].any(axis=1)):
+        lowered[int(i)] = str(words[i]).lower()
+
+    letters = codes.astype(np.min_scalar_type(len(alphabet)))[points]
+    return letters, alphabet, lowered
 
 
 def get_city(level):
@@ -383,8 +610,9 @@ def get_city(level):
         city = random.choice(response.json())
         return city["name"], "Country: " + codes[city["country"]]
     else:
-        print("Error:", response.status_code, response.text)
-        exit("get_city request failed")
+        sys.exit(
+            f"get_city request failed: Error {response.status_code} {response.text}"
+        )
 
 
 def load_hangmen(path):
@@ -408,6 +636,20 @@ def load_hangmen(path):
     return hangmen.split(",\n")
 
 
+def get_multiplier(lives):
+    """Returns score multiplier based on max lives"""
+
+    match lives:
+        case 10:
+            return 1
+        case 7:
+            return 1.5
+        case 5:
+            return 3
+        case _:
+            sys.exit("Invalid number of lives")
+
+
 def update_leaderboard(name, score, path):
     """Updates previous leaderboard"""
 
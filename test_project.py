@@ -1,5 +1,17 @@
-from project import Round, set_settings, get_word, load_hangmen, update_leaderboard
+from project import (
+    Round,
+    BatchRound,
+    WordScheduler,
+    set_settings,
+    get_word,
+    load_words,
+    get_corpus,
+    encode_words,
+    load_hangmen,
+    update_leaderboard,
+)
 from pytest import raises
+import random
 
 
 def test_set_settings():
@@ -25,6 +37,35 @@ def test_get_word():
         get_word("./empty.txt")
 
 
+def test_get_corpus():
+    assert get_corpus("./test_files/dummy_word.txt") == ("Dummy Word",) * 8
+    assert get_corpus("./words/animals/animals.txt") is get_corpus(
+        "./words/animals/animals.txt"
+    )
+    with raises(SystemExit):
+        get_corpus("./empty.txt")
+
+
+def test_WordScheduler():
+    words = get_corpus("./words/countries/countries.txt")
+    scheduler = WordScheduler(words, 50)
+    drawn = []
+    for _ in words:
+        drawn.append(scheduler.next_word())
+        assert len(scheduler.swaps) <= len(words) - scheduler.drawn
+        assert all(i >= scheduler.drawn for i in scheduler.swaps)
+        assert all(scheduler.swaps[i] != i for i in scheduler.swaps)
+    assert sorted(drawn) == sorted(words)
+    assert scheduler.swaps == {}
+
+    scheduler = WordScheduler(words, 50)
+    assert [scheduler.next_word() for _ in words] == drawn
+    assert sorted(scheduler.next_word() for _ in words) == sorted(words)
+
+    with raises(SystemExit):
+        WordScheduler(()).next_word()
+
+
 def test_load_hangmen():
     assert load_hangmen("./hangmen/default/10.txt")[10] == "\n"
     assert (
@@ -224,3 +265,101 @@ def test_Round_calculate_score():
     round.correct_guesses = ["d", "u", "y", "w", "o"]
     round.hidden_word = "Du__y Wo_d"
     assert round.calculate_score() == 210
+
+
+def test_encode_words():
+    letters, alphabet, lowered = encode_words(["Ab c", "Côte", "Z"])
+    assert alphabet == {"a": 1, "c": 2, "z": 3, "b": 4, "e": 5, "t": 6, "ô": 7}
+    assert letters.dtype == "uint8"
+    assert letters.tolist() == [[1, 4, 0, 2], [2, 7, 6, 5], [3, 0, 0, 0]]
+    assert lowered == {}
+
+    letters, alphabet, lowered = encode_words(["İstanbul", "Ankara", "ΟΔΟΣ"])
+    assert lowered == {0: "i̇stanbul", 2: "οδος"}
+
+
+def test_BatchRound_check_guess():
+    rounds = BatchRound(["Dummy Word", "Dummy"], 10)
+    rounds.check_guess("m")
+    assert rounds.hide_letters(0) == "__mm_ ____"
+    assert rounds.hide_letters(1) == "__mm_"
+
+    rounds.check_guess("wa")
+    assert rounds.hide_letters(0) == "__mm_ W___"
+    assert rounds.lives.tolist() == [10, 9]
+    assert rounds.correct_guesses.tolist() == [2, 1]
+
+    rounds.check_guess("W")
+    rounds.check_guess("!")
+    assert rounds.lives.tolist() == [10, 8]
+
+    for guess in "duy":
+        rounds.check_guess(guess)
+    assert rounds.won.tolist() == [False, True]
+    assert rounds.has_ended().tolist() == [False, True]
+    assert rounds.calculate_score().tolist() == [180, 170]
+
+    rounds = BatchRound(["İstanbul", "ΟΔΟΣ"], 10)
+    rounds.check_guess("iσ")
+    rounds.check_guess("Sς")
+    assert rounds.lives.tolist() == [10, 9]
+    assert rounds.correct_guesses.tolist() == [2, 1]
+    assert rounds.hide_letters(0) == "_s______"
+    assert rounds.hide_letters(1) == "____"
+
+    rounds = BatchRound(["ab"], 10)
+    rounds.check_guess("a")
+    rounds.check_guess("b")
+    assert rounds.won.tolist() == [True]
+
+    rounds = BatchRound(["Dummy", "Côte"], 10)
+    rounds.check_guess("é")
+    assert rounds.lives.tolist() == [9, 9]
+    rounds.check_guess("Éô")
+    assert rounds.lives.tolist() == [9, 9]
+    assert rounds.hide_letters(1) == "_ô__"
+
+    with raises(ValueError):
+        rounds.check_guess("")
+    with raises(ValueError):
+        rounds.check_guess("abc")
+
+
+def test_BatchRound_matches_Round():
+    rng = random.Random(50)
+    words = rng.sample(load_words("./words/animals/animals.txt"), 100)
+    words += rng.sample(load_words("./words/countries/countries.txt"), 100)
+    words += ["Côte d'Ivoire", "São Tomé", "Curaçao", "Zürich", "Ñuñoa"]
+    words += ["İstanbul", "ΟΔΟΣ", "ΣΑΣ", "Σ"]
+    letters = list("abcdefghijklmnopqrstuvwxyzéôçüãñσςοδα") + ["É", "Ñ", "!", "ß", "İ"]
+    guesses = [rng.sample(letters, len(letters)) for _ in words]
+
+    for lives in [10, 7, 5]:
+        rounds = BatchRound(words, lives)
+        for step in range(len(letters)):
+            rounds.check_guess("".join(guess[step] for guess in guesses))
+        won = rounds.won.copy()
+        ended = rounds.has_ended()
+        scores = rounds.calculate_score()
+
+        for i, word in enumerate(words):
+            round = Round(
+                {
+                    "lives": lives,
+                    "hangmen": "./test_files/dummy_hangman.txt",
+                    "topic": "test",
+                    "word_path": "./test_files/dummy_word.txt",
+                }
+            )
+            round.word = word
+            round.hidden_word = round.hide_letters()
+            for guess in guesses[i]:
+                if round.has_ended():
+                    break
+                round.check_guess(guess)
+
+            assert ended[i] == round.has_ended()
+            assert won[i] == round.won
+            assert rounds.lives[i] == round.lives
+            assert rounds.hide_letters(i) == round.hidden_word
+            assert scores[i] == round.calculate_score()